@@ -4,10 +4,6 @@ import platform
 import subprocess
 import sys
 from typing import List
-
-import cpuinfo
-
-import icontract
 """Run benchmarks and, if specified, overwrite README."""
 
 
@@ -24,6 +20,10 @@ def benchmark_against_others(repo_root: pathlib.Path, overwrite: bool) -> None:
                 print()
             subprocess.check_call([sys.executable, str(repo_root / script_rel_path)])
     else:
+        # Import only here so that a plain benchmark run does not pay for these imports.
+        import cpuinfo
+        import icontract
+
         out = ['The following scripts were run:\n\n']
         for script_rel_path in script_rel_paths:
             out.append('* `{0} <https://github.com/Parquery/icontract/tree/master/{0}>`_\n'.format(script_rel_path))
@@ -82,8 +82,8 @@ def measure_invariant_at_init() -> None:
     number = 1 * 1000 * 1000
 
     for i, cls in enumerate(clses):
-        duration = timeit.timeit("{}('X.Y')".format(cls), setup="from __main__ import {}".format(cls), number=number)
-        durations[i] = duration
+        timer = timeit.Timer("{}('X.Y')".format(cls), globals=globals())
+        durations[i] = min(timer.repeat(repeat=3, number=number))
 
     writeln_utf8("Benchmarking invariant at __init__:\n")
     table = []  # type: List[List[str]]
@@ -115,9 +115,8 @@ def measure_invariant_at_function() -> None:
     number = 1 * 1000 * 1000
 
     for i, cls in enumerate(clses):
-        duration = timeit.timeit(
-            "a.some_func()", setup="from __main__ import {0}; a = {0}('X.Y')".format(cls), number=number)
-        durations[i] = duration
+        timer = timeit.Timer("a.some_func()", setup="a = {}('X.Y')".format(cls), globals=globals())
+        durations[i] = min(timer.repeat(repeat=3, number=number))
 
     writeln_utf8("Benchmarking invariant at a function:\n")
     table = []  # type: List[List[str]]
@@ -62,8 +62,8 @@ def measure_functions() -> None:
     number = 10 * 1000
 
     for i, func in enumerate(funcs):
-        duration = timeit.timeit("{}(198.4)".format(func), setup="from __main__ import {}".format(func), number=number)
-        durations[i] = duration
+        timer = timeit.Timer("{}(198.4)".format(func), globals=globals())
+        durations[i] = min(timer.repeat(repeat=3, number=number))
 
     table = []  # type: List[List[str]]
 
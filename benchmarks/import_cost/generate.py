@@ -29,6 +29,17 @@ def generate_functions(functions: int, contracts: int, disabled: bool) -> str:
     return out.getvalue()
 
 
+# Dedent the class template only once instead of once per generated class.
+_CLASS_TEMPLATE = textwrap.dedent("""\
+    class SomeClass{}:
+        def __init__(self) -> None:
+            self.x = 100
+
+        def some_func(self) -> None:
+            pass
+    """)
+
+
 def generate_classes(classes: int, invariants: int, disabled: bool) -> str:
     out = io.StringIO()
     out.write("#!/usr/bin/env python3\n")
@@ -44,15 +55,7 @@ def generate_classes(classes: int, invariants: int, disabled: bool) -> str:
             else:
                 out.write("@icontract.invariant(lambda self: self.x > {}, enabled=False)\n".format(j))
 
-        out.write(
-            textwrap.dedent("""\
-            class SomeClass{}:
-                def __init__(self) -> None:
-                    self.x = 100
-                    
-                def some_func(self) -> None:
-                    pass
-            """.format(i)))
+        out.write(_CLASS_TEMPLATE.format(i))
 
     return out.getvalue()
 
@@ -6,6 +6,7 @@ Execute this script multiple times to get a better estimate.
 """
 
 import argparse
+import importlib
 import time
 
 
@@ -35,78 +36,10 @@ def main() -> None:
     args = parser.parse_args()
 
     a_module = str(args.module)
-    if a_module == "functions_100_with_no_contract":
-        start = time.time()
-        import functions_100_with_no_contract
-        print(time.time() - start)
 
-    elif a_module == "functions_100_with_1_contract":
-        start = time.time()
-        import functions_100_with_1_contract
-        print(time.time() - start)
-
-    elif a_module == "functions_100_with_5_contracts":
-        start = time.time()
-        import functions_100_with_5_contracts
-        print(time.time() - start)
-
-    elif a_module == "functions_100_with_10_contracts":
-        start = time.time()
-        import functions_100_with_10_contracts
-        print(time.time() - start)
-
-    elif a_module == "functions_100_with_1_disabled_contract":
-        start = time.time()
-        import functions_100_with_1_disabled_contract
-        print(time.time() - start)
-
-    elif a_module == "functions_100_with_5_disabled_contracts":
-        start = time.time()
-        import functions_100_with_5_disabled_contracts
-        print(time.time() - start)
-
-    elif a_module == "functions_100_with_10_disabled_contracts":
-        start = time.time()
-        import functions_100_with_10_disabled_contracts
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_no_invariant":
-        start = time.time()
-        import classes_100_with_no_invariant
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_1_invariant":
-        start = time.time()
-        import classes_100_with_1_invariant
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_5_invariants":
-        start = time.time()
-        import classes_100_with_5_invariants
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_10_invariants":
-        start = time.time()
-        import classes_100_with_10_invariants
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_1_disabled_invariant":
-        start = time.time()
-        import classes_100_with_1_disabled_invariant
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_5_disabled_invariants":
-        start = time.time()
-        import classes_100_with_5_disabled_invariants
-        print(time.time() - start)
-
-    elif a_module == "classes_100_with_10_disabled_invariants":
-        start = time.time()
-        import classes_100_with_10_disabled_invariants
-        print(time.time() - start)
-
-    else:
-        raise NotImplementedError("Unhandled module: {}".format(a_module))
+    start = time.time()
+    importlib.import_module(a_module)
+    print(time.time() - start)
 
 
 if __name__ == "__main__":
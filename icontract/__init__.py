@@ -44,3 +44,7 @@ _Snapshot = icontract._types.Snapshot
 
 import icontract.errors
 ViolationError = icontract.errors.ViolationError
+
+# Spell out the public interface so that clients iterating over the namespace do not need to
+# fall back to dir(), which would also enumerate the aliased submodules.
+__all__ = ['require', 'snapshot', 'ensure', 'invariant', 'aRepr', 'SLOW', 'DBCMeta', 'DBC', 'ViolationError']
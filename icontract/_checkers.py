@@ -63,8 +63,7 @@ def _kwargs_from_call(param_names: List[str], kwdefaults: Dict[str, Any], args:
     resolved_kwargs = {'_ARGS': args, '_KWARGS': kwargs}
 
     # Set the default argument values as condition parameters.
-    for param_name, param_value in kwdefaults.items():
-        resolved_kwargs[param_name] = param_value
+    resolved_kwargs.update(kwdefaults)
 
     # Override the defaults with the values actually supplied to the function.
     for i, func_arg in enumerate(args):
@@ -76,8 +75,7 @@ def _kwargs_from_call(param_names: List[str], kwdefaults: Dict[str, Any], args:
             # instead of frankensteining the exception here.
             pass
 
-    for key, val in kwargs.items():
-        resolved_kwargs[key] = val
+    resolved_kwargs.update(kwargs)
 
     return resolved_kwargs
 
@@ -455,16 +453,10 @@ def decorate_with_checker(func: CallableT) -> CallableT:
     return wrapper  # type: ignore
 
 
-def _find_self(param_names: List[str], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
-    """Find the instance of ``self`` in the arguments."""
-    instance_i = None
-    try:
-        instance_i = param_names.index("self")
-    except ValueError:
-        pass
-
-    if instance_i is not None:
-        return args[instance_i]
+def _find_self(self_i: int, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """Find the instance of ``self`` in the arguments given its index in the parameters (-1 if not positional)."""
+    if self_i >= 0:
+        return args[self_i]
 
     return kwargs["self"]
 
@@ -511,12 +503,18 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
     sign = inspect.signature(func)
     param_names = list(sign.parameters.keys())
 
+    # Search for the position of ``self`` only once at decoration time instead of on every call.
+    try:
+        self_i = param_names.index("self")
+    except ValueError:
+        self_i = -1
+
     if is_init:
 
         def wrapper(*args, **kwargs):  # type: ignore
             """Wrap __init__ method of a class by checking the invariants *after* the invocation."""
             try:
-                instance = _find_self(param_names=param_names, args=args, kwargs=kwargs)
+                instance = _find_self(self_i=self_i, args=args, kwargs=kwargs)
             except KeyError as err:
                 raise KeyError(("The parameter 'self' could not be found in the call to function {!r}: "
                                 "the param names were {!r}, the args were {!r} and kwargs were {!r}").format(
@@ -543,7 +541,7 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
         def wrapper(*args, **kwargs):  # type: ignore
             """Wrap a function of a class by checking the invariants *before* and *after* the invocation."""
             try:
-                instance = _find_self(param_names=param_names, args=args, kwargs=kwargs)
+                instance = _find_self(self_i=self_i, args=args, kwargs=kwargs)
             except KeyError as err:
                 raise KeyError(("The parameter 'self' could not be found in the call to function {!r}: "
                                 "the param names were {!r}, the args were {!r} and kwargs were {!r}").format(
@@ -598,6 +596,13 @@ def _already_decorated_with_invariants(func: CallableT) -> bool:
     return already_decorated
 
 
+# __new__ is a special class method (though not marked properly with @classmethod!).
+# We need to ignore __repr__ to prevent endless loops when generating error messages.
+# __getattribute__, __setattr__ and __delattr__ are too invasive and alter the state of the instance.
+# Hence we don't consider them "public".
+_IGNORED_INVARIANT_NAMES = frozenset(["__new__", "__repr__", "__getattribute__", "__setattr__", "__delattr__"])
+
+
 def add_invariant_checks(cls: type) -> None:
     """Decorate each of the class functions with invariant checks if not already decorated."""
     # pylint: disable=too-many-branches
@@ -608,14 +613,12 @@ def add_invariant_checks(cls: type) -> None:
     names_properties = []  # type: List[Tuple[str, property]]
 
     # Filter out entries in the directory which are certainly not candidates for decoration.
-    for name, value in [(name, getattr(cls, name)) for name in dir(cls)]:
-        # __new__ is a special class method (though not marked properly with @classmethod!).
-        # We need to ignore __repr__ to prevent endless loops when generating error messages.
-        # __getattribute__, __setattr__ and __delattr__ are too invasive and alter the state of the instance.
-        # Hence we don't consider them "public".
-        if name in ["__new__", "__repr__", "__getattribute__", "__setattr__", "__delattr__"]:
+    for name in dir(cls):
+        if name in _IGNORED_INVARIANT_NAMES:
             continue
 
+        value = getattr(cls, name)
+
         if name == "__init__":
             assert inspect.isfunction(value) or isinstance(value, _SLOT_WRAPPER_TYPE), \
                 "Expected __init__ to be either a function or a slot wrapper, but got: {}".format(type(value))
@@ -201,11 +201,11 @@ def _decorate_namespace_property(bases: List[type], namespace: MutableMapping[st
                     "Expected base {} to have {} as property, but got: {}".format(base, key, base_property)
 
                 if func == value.fget:
-                    base_func = getattr(base, key).fget
+                    base_func = base_property.fget
                 elif func == value.fset:
-                    base_func = getattr(base, key).fset
+                    base_func = base_property.fset
                 elif func == value.fdel:
-                    base_func = getattr(base, key).fdel
+                    base_func = base_property.fdel
                 else:
                     raise NotImplementedError("Unhandled case: func neither value.fget, value.fset nor value.fdel")
 
@@ -5,7 +5,7 @@ import re
 import reprlib
 import sys
 import textwrap
-import uuid
+import weakref
 from typing import Any, Mapping, MutableMapping, Callable, List, Dict, Iterable, cast  # pylint: disable=unused-import
 from typing import Optional, Tuple  # pylint: disable=unused-import
 
@@ -189,8 +189,12 @@ class ConditionLambdaInspection:
         self.text = atok.get_text(node.body)
 
 
-_DECORATOR_RE = re.compile(r'^\s*@[a-zA-Z_]')
-_DEF_CLASS_RE = re.compile(r'^\s*(def |class )')
+# The ``^`` anchor is redundant since ``match`` already anchors at the start of the string.
+_DECORATOR_RE = re.compile(r'\s*@[a-zA-Z_]')
+
+# Match either a decorator or the start of a function/class definition so that the scan for
+# the end of a decorator needs only a single pattern match per line.
+_DECORATOR_OR_DEF_CLASS_RE = re.compile(r'\s*(@[a-zA-Z_]|def |class )')
 
 
 class DecoratorInspection:
@@ -236,7 +240,7 @@ def inspect_decorator(lines: List[str], lineno: int, filename: str) -> Decorator
     for i in range(lineno + 1, len(lines)):
         line = lines[i]
 
-        if _DECORATOR_RE.match(line) or _DEF_CLASS_RE.match(line):
+        if _DECORATOR_OR_DEF_CLASS_RE.match(line):
             decorator_end_lineno = i
             break
 
@@ -247,7 +251,9 @@ def inspect_decorator(lines: List[str], lineno: int, filename: str) -> Decorator
     decorator_lines = lines[decorator_lineno:decorator_end_lineno]
 
     # We need to dedent the decorator and add a dummy decoratee so that we can parse its text as valid source code.
-    decorator_text = textwrap.dedent("".join(decorator_lines)) + "def dummy_{}(): pass".format(uuid.uuid4().hex)
+    # The name of the decoratee is irrelevant since the parsed module is never executed, so a fixed name suffices
+    # and we do not need to draw a random one.
+    decorator_text = textwrap.dedent("".join(decorator_lines)) + "def dummy_icontract(): pass"
 
     atok = asttokens.ASTTokens(decorator_text, parse=True)
 
@@ -378,6 +384,66 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
     return parts
 
 
+# Cache the source lookups of the condition functions.
+#
+# ``inspect.findsource`` re-reads and splits the whole source file on every call, which is wasteful
+# when the same contract is violated repeatedly. The cache is keyed on the code object of
+# the condition so that the look-up is paid only once per condition. The keys are referenced
+# weakly so that conditions created dynamically (e.g., in exec'ed code) do not accumulate
+# in the cache once their code objects are garbage-collected.
+_FIND_SOURCE_CACHE = weakref.WeakKeyDictionary()  # type: MutableMapping[Any, Tuple[List[str], int, str]]
+
+
+def _find_source(condition: Callable[..., bool]) -> Tuple[List[str], int, str]:
+    """
+    Find the source lines and the line number corresponding to the condition function.
+
+    :param condition: condition function of a contract
+    :return: tuple of (lines of the source file, line number of the condition, filename)
+    """
+    result = _FIND_SOURCE_CACHE.get(condition.__code__, None)
+    if result is None:
+        lines, condition_lineno = inspect.findsource(condition)
+        filename = inspect.getsourcefile(condition)
+        assert filename is not None
+
+        result = (lines, condition_lineno, filename)
+        _FIND_SOURCE_CACHE[condition.__code__] = result
+
+    return result
+
+
+# Cache the parsed inspections of the lambda conditions.
+#
+# Re-tokenizing and re-parsing the decorator on every violation is expensive, while the inspection
+# depends only on the source location of the condition. The cache is keyed on the code object of
+# the condition, analogous to ``_FIND_SOURCE_CACHE``.
+_LAMBDA_INSPECTION_CACHE = weakref.WeakKeyDictionary()  # type: MutableMapping[Any, ConditionLambdaInspection]
+
+
+def _inspect_lambda_condition(condition: Callable[..., bool]) -> Optional[ConditionLambdaInspection]:
+    """
+    Parse the source of the lambda condition into an inspection.
+
+    The source file corresponding to the condition is parsed only once and the inspection is cached
+    for all the further violations of the same contract.
+
+    :param condition: condition function of a contract given as a lambda function
+    :return: inspected lambda AST node together with the parsed tokens
+    """
+    lambda_inspection = _LAMBDA_INSPECTION_CACHE.get(condition.__code__, None)
+    if lambda_inspection is None:
+        lines, condition_lineno, filename = _find_source(condition=condition)
+
+        decorator_inspection = inspect_decorator(lines=lines, lineno=condition_lineno, filename=filename)
+        lambda_inspection = find_lambda_condition(decorator_inspection=decorator_inspection)
+
+        if lambda_inspection is not None:
+            _LAMBDA_INSPECTION_CACHE[condition.__code__] = lambda_inspection
+
+    return lambda_inspection
+
+
 def generate_message(contract: Contract, condition_kwargs: Mapping[str, Any]) -> str:
     """Generate the message upon contract violation."""
     # pylint: disable=protected-access
@@ -395,14 +461,7 @@ def generate_message(contract: Contract, condition_kwargs: Mapping[str, Any]) ->
     else:
         # We need to extract the source code corresponding to the decorator since inspect.getsource() is broken with
         # lambdas.
-
-        # Find the line corresponding to the condition lambda
-        lines, condition_lineno = inspect.findsource(contract.condition)
-        filename = inspect.getsourcefile(contract.condition)
-        assert filename is not None
-
-        decorator_inspection = inspect_decorator(lines=lines, lineno=condition_lineno, filename=filename)
-        lambda_inspection = find_lambda_condition(decorator_inspection=decorator_inspection)
+        lambda_inspection = _inspect_lambda_condition(condition=contract.condition)
 
         assert lambda_inspection is not None, \
             "Expected lambda_inspection to be non-None if _is_lambda is True on: {}".format(contract.condition)
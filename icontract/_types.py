@@ -13,6 +13,13 @@ class Contract:
 
     # pylint: disable=too-many-instance-attributes
 
+    # Contracts are pure data holders which can be instantiated in large numbers (one per decorator),
+    # so we avoid the per-instance __dict__.
+    __slots__ = [
+        "condition", "condition_args", "condition_arg_set", "mandatory_args", "description", "_a_repr", "error",
+        "error_args", "error_arg_set", "location"
+    ]
+
     def __init__(self,
                  condition: Callable[..., bool],
                  description: Optional[str] = None,
@@ -64,6 +71,9 @@ class Contract:
 class Snapshot:
     """Define a snapshot of an argument *prior* to the function invocation that is later supplied to a postcondition."""
 
+    # Snapshots are pure data holders analogous to Contracts, so we avoid the per-instance __dict__ as well.
+    __slots__ = ["capture", "name", "args", "arg_set", "location"]
+
     def __init__(self, capture: Callable[..., Any], name: Optional[str] = None, location: Optional[str] = None) -> None:
         """
         Initialize.
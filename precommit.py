@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Runs precommit checks on the repository."""
 import argparse
+import concurrent.futures
 import os
 import pathlib
 import subprocess
 import sys
+from typing import Any, List
 
 
 def main() -> int:
@@ -22,6 +24,12 @@ def main() -> int:
 
     repo_root = pathlib.Path(__file__).parent
 
+    def run(cmd: List[str], **kwargs: Any) -> 'subprocess.CompletedProcess':
+        """Run the command in the repository root and check the return code by default."""
+        kwargs.setdefault("cwd", str(repo_root))
+        kwargs.setdefault("check", True)
+        return subprocess.run(cmd, **kwargs)
+
     print("YAPF'ing...")
     yapf_targets = ["tests", "icontract", "setup.py", "precommit.py", "benchmark.py", "benchmarks", "tests_with_others"]
 
@@ -29,51 +37,60 @@ def main() -> int:
         yapf_targets.append('tests_3_8')
 
     if overwrite:
-        subprocess.check_call(
-            ["yapf", "--in-place", "--style=style.yapf", "--recursive"] + yapf_targets, cwd=str(repo_root))
+        run(["yapf", "--in-place", "--style=style.yapf", "--recursive"] + yapf_targets)
     else:
-        subprocess.check_call(
-            ["yapf", "--diff", "--style=style.yapf", "--recursive"] + yapf_targets, cwd=str(repo_root))
-
-    print("Mypy'ing...")
-    mypy_targets = ["icontract", "tests"]
-    if sys.version_info >= (3, 8):
-        mypy_targets.append('tests_3_8')
-
-    subprocess.check_call(["mypy", "--strict"] + mypy_targets, cwd=str(repo_root))
-
-    print("Pylint'ing...")
-    pylint_targets = ['icontract', 'tests']
+        run(["yapf", "--diff", "--style=style.yapf", "--recursive"] + yapf_targets)
 
+    # Mypy and pylint check the same set of directories, so we collect the list only once.
+    lint_targets = ["icontract", "tests"]
     if sys.version_info >= (3, 8):
-        pylint_targets.append('tests_3_8')
-    subprocess.check_call(["pylint", "--rcfile=pylint.rc"] + pylint_targets, cwd=str(repo_root))
-
-    print("Pydocstyle'ing...")
-    subprocess.check_call(["pydocstyle", "icontract"], cwd=str(repo_root))
+        lint_targets.append('tests_3_8')
+
+    # Mypy, pylint and pydocstyle are independent static checks, so we run them in parallel.
+    # Threads are sufficient since the actual work happens in the subprocesses.
+    # Mind that yapf has to run before since it possibly re-writes the files in place.
+    checks = [
+        ("Mypy'ing...", ["mypy", "--strict"] + lint_targets),
+        ("Pylint'ing...", ["pylint", "--rcfile=pylint.rc"] + lint_targets),
+        ("Pydocstyle'ing...", ["pydocstyle", "icontract"]),
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            executor.submit(
+                run, cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+            for _, cmd in checks
+        ]
+
+        for (header, _), future in zip(checks, futures):
+            print(header)
+            proc = future.result()
+            sys.stdout.write(proc.stdout)
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args, output=proc.stdout)
 
     print("Testing...")
     env = os.environ.copy()
     env['ICONTRACT_SLOW'] = 'true'
 
     # yapf: disable
-    subprocess.check_call(
+    run(
         ["coverage", "run",
          "--source", "icontract",
          "-m", "unittest", "discover"],
-        cwd=str(repo_root),
         env=env)
     # yapf: enable
 
-    subprocess.check_call(["coverage", "report"])
+    run(["coverage", "report"])
 
     print("Doctesting...")
-    subprocess.check_call([sys.executable, "-m", "doctest", "README.rst"])
-    for pth in (repo_root / "icontract").glob("**/*.py"):
-        subprocess.check_call([sys.executable, "-m", "doctest", str(pth)])
+    # Doctest all the files in a single interpreter so that we don't pay the interpreter start-up
+    # and the icontract import once per file.
+    doc_files = ["README.rst"] + sorted(str(pth) for pth in (repo_root / "icontract").glob("**/*.py"))
+    run([sys.executable, "-m", "doctest"] + doc_files)
 
     print("Checking the restructured text of the readme...")
-    subprocess.check_call([sys.executable, 'setup.py', 'check', '--restructuredtext', '--strict'])
+    run([sys.executable, 'setup.py', 'check', '--restructuredtext', '--strict'])
 
     return 0
 
@@ -2,7 +2,7 @@
 """Manipulate the error text."""
 import re
 
-_LOCATION_RE = re.compile(r'\AFile [^\n]+, line [0-9]+ in [a-zA-Z_0-9]+:\n(.*)\Z', flags=re.MULTILINE | re.DOTALL)
+_LOCATION_RE = re.compile(r'File [^\n]+, line [0-9]+ in [a-zA-Z_0-9]+:\n(.*)', flags=re.DOTALL)
 
 
 def wo_mandatory_location(text: str) -> str:
@@ -19,10 +19,10 @@ def wo_mandatory_location(text: str) -> str:
     >>> wo_mandatory_location(text='a text')
     Traceback (most recent call last):
     ...
-    AssertionError: Expected the text to match \AFile [^\n]+, line [0-9]+ in [a-zA-Z_0-9]+:\n(.*)\Z, but got: 'a text'
+    AssertionError: Expected the text to fully match File [^\n]+, line [0-9]+ in [a-zA-Z_0-9]+:\n(.*), but got: 'a text'
     """
-    mtch = _LOCATION_RE.match(text)
+    mtch = _LOCATION_RE.fullmatch(text)
     if not mtch:
-        raise AssertionError("Expected the text to match {}, but got: {!r}".format(_LOCATION_RE.pattern, text))
+        raise AssertionError("Expected the text to fully match {}, but got: {!r}".format(_LOCATION_RE.pattern, text))
 
     return mtch.group(1)
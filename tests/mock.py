@@ -5,6 +5,10 @@ from typing import List, Union
 class NumpyArray:
     """Represent a class that mocks a numpy.array and it's behavior on less-then operator."""
 
+    # The comparison operators spawn a new instance per element-wise comparison, so avoid
+    # allocating a __dict__ for every instance.
+    __slots__ = ("values", )
+
     def __init__(self, values: List[Union[int, bool]]) -> None:
         """Initialize with the given values."""
         self.values = values